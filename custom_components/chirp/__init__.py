@@ -7,6 +7,7 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 
+from .config_flow import generate_unique_id
 from .const import CONF_APPLICATION_ID, DOMAIN, GRPCLIENT, MQTTCLIENT
 from .grpc import ChirpGrpc
 from .mqtt import ChirpToHA
@@ -61,6 +62,18 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return True
 
 
+async def async_migrate_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Migrate old config entry to the current version."""
+    _LOGGER.debug("async_migrate_entry from version %s", entry.version)
+    if entry.version == 1:
+        # Version 2 switched unique id hashing from md5 to blake2b
+        hass.config_entries.async_update_entry(
+            entry, unique_id=generate_unique_id(entry.data), version=2
+        )
+    _LOGGER.debug("async_migrate_entry completed, version %s", entry.version)
+    return True
+
+
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Reload config entry when options change."""
     await hass.config_entries.async_reload(entry.entry_id)
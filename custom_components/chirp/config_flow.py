@@ -1,6 +1,7 @@
 """The ChirpStack LoRaWAN Integration - base configuration."""
 import hashlib
 import logging
+from operator import itemgetter
 import time
 import asyncio
 from typing import Any
@@ -59,38 +60,83 @@ from .const import (
     DEFAULT_OPTIONS_START_DELAY,
     DEFAULT_TENANT,
     DOMAIN,
+    GRPCLIENT,
 )
 from .grpc import ChirpGrpc
 from .mqtt import ChirpToHA
 
 _LOGGER = logging.getLogger(__name__)
 
+_RPC_CACHE_TTL = 30  # seconds to reuse tenants lookup within a flow
+
+_MQTT_KEYS = (
+    CONF_MQTT_SERVER,
+    CONF_MQTT_PORT,
+    CONF_MQTT_USER,
+    CONF_MQTT_PWD,
+    CONF_MQTT_DISC,
+    CONF_MQTT_CHIRPSTACK_PREFIX,
+)
+_mqtt_settings = itemgetter(*_MQTT_KEYS)
+
+_USER_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_API_SERVER, default=DEFAULT_API_SERVER): vol.All(
+            str, vol.Length(min=3)
+        ),
+        vol.Required(CONF_API_PORT, default=DEFAULT_API_PORT): vol.All(
+            int, vol.Range(min=0, max=0xffff)
+        ),
+        vol.Required(CONF_API_KEY, default=DEFAULT_API_KEY): vol.All(
+            str, vol.Length(min=10)
+        ),
+    }
+)
+
+_MQTT_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_MQTT_SERVER, default=DEFAULT_MQTT_SERVER): vol.All(
+            str, vol.Length(min=3)
+        ),
+        vol.Required(CONF_MQTT_PORT, default=DEFAULT_MQTT_PORT): vol.All(
+            int, vol.Range(min=0, max=0xffff)
+        ),
+        vol.Required(CONF_MQTT_USER, default=DEFAULT_MQTT_USER): vol.All(
+            str, vol.Length(min=1)
+        ),
+        vol.Required(CONF_MQTT_PWD, default=DEFAULT_MQTT_PWD): str,
+        vol.Required(CONF_MQTT_DISC, default=DEFAULT_MQTT_DISC): vol.All(
+            str, vol.Length(min=1)
+        ),
+        vol.Optional(
+            CONF_MQTT_CHIRPSTACK_PREFIX, default=DEFAULT_MQTT_CHIRPSTACK_PREFIX
+        ): str,
+    }
+)
+
 
 def generate_unique_id(configuration):
     """Create untegration unique id based on api/mqtt servers configurations."""
-    u_id = "".join(
-        [
-            str(configuration[id_key])
-            for id_key in (
-                CONF_API_SERVER,
-                CONF_API_PORT,
-                CONF_TENANT,
-                CONF_APPLICATION,
-                CONF_MQTT_SERVER,
-                CONF_MQTT_PORT,
-                CONF_MQTT_DISC,
-                CONF_MQTT_CHIRPSTACK_PREFIX,
-            )
-        ]
-    )
-    unique_id = f"{hashlib.md5(u_id.encode('utf-8')).hexdigest()}"
-    return unique_id
+    u_id = hashlib.blake2b(digest_size=16)
+    for id_key in (
+        CONF_API_SERVER,
+        CONF_API_PORT,
+        CONF_TENANT,
+        CONF_APPLICATION,
+        CONF_MQTT_SERVER,
+        CONF_MQTT_PORT,
+        CONF_MQTT_DISC,
+        CONF_MQTT_CHIRPSTACK_PREFIX,
+    ):
+        u_id.update(str(configuration[id_key]).encode("utf-8"))
+        u_id.update(b"\x1f")  # field separator, "a"+"bc" must differ from "ab"+"c"
+    return u_id.hexdigest()
 
 
 class ChirpConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """ChirpStack LoRaWAN configuration flow."""
 
-    VERSION = 1
+    VERSION = 2
     CONNECTION_CLASS = config_entries.CONN_CLASS_LOCAL_POLL
     _grpc_channel = None
     _tenants_list = None
@@ -98,15 +144,48 @@ class ChirpConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     _input = None
     _tenant_id = None
     _app_id = None
+    _grpc_key = None
+    _tenant_selector = None
+    _app_selector = None
+    _last_schema = None
 
     def __init__(self) -> None:
         """Set initial values for ChirpConfigFlow."""
         _LOGGER.debug("ChirpConfigFlow.__init__")
+        self._rpc_cache: dict[tuple, tuple[float, dict]] = {}
+
+    def _get_cached_rpc(self, key):
+        """Return memoized tenants lookup if still fresh, None otherwise."""
+        cached = self._rpc_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < _RPC_CACHE_TTL:
+            return cached[1]
+        return None
+
+    def _set_cached_rpc(self, key, value):
+        """Memoize tenants lookup result."""
+        self._rpc_cache[key] = (time.monotonic(), value)
+
+    def _suggested_schema(self, step_id, schema, suggested_values):
+        """Return schema with suggested values, reusing the last render of the same step and values."""
+        key = (step_id, tuple(sorted(suggested_values.items())))
+        if self._last_schema is None or self._last_schema[0] != key:
+            self._last_schema = (
+                key,
+                self.add_suggested_values_to_schema(schema, suggested_values),
+            )
+        return self._last_schema[1]
 
-    def __del__(self):
-        """Close grpc channel on exit."""
+    async def _async_close_grpc(self):
+        """Close grpc channel once it is no longer needed by the flow."""
         if self._grpc_channel:
-            self._grpc_channel.close()
+            grpc_channel, self._grpc_channel, self._grpc_key = self._grpc_channel, None, None
+            await self.hass.async_add_executor_job(grpc_channel.close)
+
+    @callback
+    def async_remove(self) -> None:
+        """Close grpc channel if flow is discarded before reaching a final step."""
+        if self._grpc_channel:
+            self.hass.async_create_task(self._async_close_grpc())
 
     async def async_step_user(self, user_input: dict[str, Any] = None) -> FlowResult:
         """Run initial configuration step, check grpc api server access, proceed to tenant/application selection."""
@@ -115,10 +194,45 @@ class ChirpConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         if user_input is not None:
             try:
                 user_input[CONF_APPLICATION_ID] = ""
-                self._grpc_channel = ChirpGrpc(user_input, None)
-                self._tenants_list = self._grpc_channel.get_chirp_tenants()
+                grpc_key = (
+                    user_input[CONF_API_SERVER],
+                    user_input[CONF_API_PORT],
+                    user_input[CONF_API_KEY],
+                )
+                # Reuse channel and tenants list if the same server was queried recently
+                self._tenants_list = (
+                    self._get_cached_rpc(grpc_key)
+                    if grpc_key == self._grpc_key
+                    else None
+                )
+                if self._tenants_list is None:
+                    # Channel to previously queried server is replaced
+                    await self._async_close_grpc()
+
+                    # Connect and list tenants in executor to avoid blocking
+                    def connect_and_list_tenants():
+                        grpc_channel = ChirpGrpc(user_input, None)
+                        try:
+                            return grpc_channel, grpc_channel.get_chirp_tenants()
+                        except Exception:
+                            grpc_channel.close()
+                            raise
+
+                    (
+                        self._grpc_channel,
+                        self._tenants_list,
+                    ) = await self.hass.async_add_executor_job(connect_and_list_tenants)
+                    self._grpc_key = grpc_key
+                    if self._tenants_list:
+                        self._set_cached_rpc(grpc_key, self._tenants_list)
+                self._tenant_selector = SelectSelector(
+                    SelectSelectorConfig(
+                        options=list(self._tenants_list),
+                        mode=SelectSelectorMode.DROPDOWN,
+                    )
+                )
                 _LOGGER.info("tenants_list %s", self._tenants_list)
-                if self._tenants_list == {}:
+                if not self._tenants_list:
                     errors[CONF_API_SERVER] = CONF_CHIRP_NO_TENANTS
                 else:
                     self._input = user_input
@@ -136,28 +250,7 @@ class ChirpConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         chirp_configuration = self.async_show_form(
             step_id="user",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(
-                        CONF_API_SERVER,
-                        default=DEFAULT_API_SERVER
-                        if not user_input
-                        else user_input[CONF_API_SERVER],
-                    ): vol.All(str,vol.Length(min=3)),
-                    vol.Required(
-                        CONF_API_PORT,
-                        default=DEFAULT_API_PORT
-                        if not user_input
-                        else user_input[CONF_API_PORT],
-                    ): vol.All(int, vol.Range(min=0,max=0xffff)),
-                    vol.Required(
-                        CONF_API_KEY,
-                        default=DEFAULT_API_KEY
-                        if not user_input
-                        else user_input[CONF_API_KEY],
-                    ): vol.All(str,vol.Length(min=10)),
-                }
-            ),
+            data_schema=self._suggested_schema("user", _USER_SCHEMA, user_input or {}),
             errors=errors,
         )
         return chirp_configuration
@@ -168,17 +261,24 @@ class ChirpConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         """Select tenant, autoselect if only 1 exists."""
         errors = {}
 
-        if len(list(self._tenants_list.keys())) == 1:
-            user_input = {CONF_TENANT: list(self._tenants_list.keys())[0]}
+        tenant_keys = list(self._tenants_list)
+        if len(tenant_keys) == 1:
+            user_input = {CONF_TENANT: tenant_keys[0]}
 
         if user_input is not None:
             self._input |= user_input
             selected_tenant = user_input[CONF_TENANT]
             self._tenant_id = self._tenants_list[selected_tenant]
-            self._apps_list = self._grpc_channel.get_tenant_applications(
-                self._tenant_id
+            self._apps_list = await self.hass.async_add_executor_job(
+                self._grpc_channel.get_tenant_applications, self._tenant_id
             )
-            if self._apps_list == {}:
+            self._app_selector = SelectSelector(
+                SelectSelectorConfig(
+                    options=list(self._apps_list),
+                    mode=SelectSelectorMode.DROPDOWN,
+                )
+            )
+            if not self._apps_list:
                 errors[CONF_API_SERVER] = CONF_ERROR_NO_APPS
             else:
                 return await self.async_step_select_application()
@@ -190,12 +290,7 @@ class ChirpConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     vol.Required(
                         CONF_TENANT,
                         default=DEFAULT_TENANT,
-                    ): SelectSelector(
-                        SelectSelectorConfig(
-                            options=list(self._tenants_list.keys()),
-                            mode=SelectSelectorMode.DROPDOWN,
-                        )
-                    ),
+                    ): self._tenant_selector,
                 }
             ),
             errors=errors,
@@ -208,8 +303,9 @@ class ChirpConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         """Select application, autoselect if only 1 exists."""
         errors = {}
 
-        if len(list(self._apps_list.keys())) == 1:
-            user_input = {CONF_APPLICATION: list(self._apps_list.keys())[0]}
+        app_keys = list(self._apps_list)
+        if len(app_keys) == 1:
+            user_input = {CONF_APPLICATION: app_keys[0]}
 
         if user_input is not None:
             self._input |= user_input
@@ -222,16 +318,10 @@ class ChirpConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             step_id="select_application",
             data_schema=vol.Schema(
                 {
-                    vol.Required(CONF_APPLICATION, default=DEFAULT_APPLICATION): str,
                     vol.Required(
                         CONF_APPLICATION,
                         default=DEFAULT_APPLICATION,
-                    ): SelectSelector(
-                        SelectSelectorConfig(
-                            options=list(self._apps_list.keys()),
-                            mode=SelectSelectorMode.DROPDOWN,
-                        )
-                    ),
+                    ): self._app_selector,
                 }
             ),
             errors=errors,
@@ -253,14 +343,16 @@ class ChirpConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 try:
                     self._abort_if_unique_id_configured()
                 except data_entry_flow.AbortFlow:
+                    await self._async_close_grpc()
                     return self.async_abort(reason=CONF_CHIRP_SERVER_RESERVED)
 
-                entry = lambda: None
-                entry.data = self._input
-                entry.options = {}
-                entry.unique_id = unique_id
-                mqtt_client = ChirpToHA(entry.data, None, None, self._grpc_channel, connectivity_check_only=True)
-                mqtt_client.close()
+                # Test MQTT connection in executor to avoid blocking
+                def test_mqtt_connection():
+                    mqtt_client = ChirpToHA(self._input, None, None, self._grpc_channel, connectivity_check_only=True)
+                    mqtt_client.close()
+
+                await self.hass.async_add_executor_job(test_mqtt_connection)
+                await self._async_close_grpc()
                 _LOGGER.debug("ChirpConfigFlow.async_step_configure_mqtt creating configuration entry")
                 return self.async_create_entry(
                     title=DEFAULT_NAME,
@@ -287,45 +379,8 @@ class ChirpConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         chirp_configuration = self.async_show_form(
             step_id="configure_mqtt",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(
-                        CONF_MQTT_SERVER,
-                        default=DEFAULT_MQTT_SERVER
-                        if not user_input
-                        else user_input[CONF_MQTT_SERVER],
-                    ): vol.All(str,vol.Length(min=3)),
-                    vol.Required(
-                        CONF_MQTT_PORT,
-                        default=DEFAULT_MQTT_PORT
-                        if not user_input
-                        else user_input[CONF_MQTT_PORT],
-                    ): vol.All(int, vol.Range(min=0,max=0xffff)),
-                    vol.Required(
-                        CONF_MQTT_USER,
-                        default=DEFAULT_MQTT_USER
-                        if not user_input
-                        else user_input[CONF_MQTT_USER],
-                    ): vol.All(str,vol.Length(min=1)),
-                    vol.Required(
-                        CONF_MQTT_PWD,
-                        default=DEFAULT_MQTT_PWD
-                        if not user_input
-                        else user_input[CONF_MQTT_PWD],
-                    ): str,
-                    vol.Required(
-                        CONF_MQTT_DISC,
-                        default=DEFAULT_MQTT_DISC
-                        if not user_input
-                        else user_input[CONF_MQTT_DISC],
-                    ): vol.All(str,vol.Length(min=1)),
-                    vol.Optional(
-                        CONF_MQTT_CHIRPSTACK_PREFIX,
-                        default=DEFAULT_MQTT_CHIRPSTACK_PREFIX
-                        if not user_input
-                        else user_input.get(CONF_MQTT_CHIRPSTACK_PREFIX, DEFAULT_MQTT_CHIRPSTACK_PREFIX),
-                    ): str,
-                }
+            data_schema=self._suggested_schema(
+                "configure_mqtt", _MQTT_SCHEMA, user_input or {}
             ),
             errors=errors,
         )
@@ -344,6 +399,90 @@ class ChirpOptionsFlow(config_entries.OptionsFlow):
     def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
         """Initialize options flow."""
         self._config_entry = config_entry
+        # Defaults follow current entry values, build once for all renders of this flow
+        self._options_schema = vol.Schema(
+            {
+                # ChirpStack API Settings
+                vol.Required(
+                    CONF_API_SERVER,
+                    default=config_entry.data.get(CONF_API_SERVER, DEFAULT_API_SERVER),
+                ): vol.All(str, vol.Length(min=3)),
+                vol.Required(
+                    CONF_API_PORT,
+                    default=config_entry.data.get(CONF_API_PORT, DEFAULT_API_PORT),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=0xffff)),
+                vol.Required(
+                    CONF_API_KEY,
+                    default=config_entry.data.get(CONF_API_KEY, DEFAULT_API_KEY),
+                ): str,
+                # MQTT Settings
+                vol.Required(
+                    CONF_MQTT_SERVER,
+                    default=config_entry.data.get(CONF_MQTT_SERVER, DEFAULT_MQTT_SERVER),
+                ): vol.All(str, vol.Length(min=3)),
+                vol.Required(
+                    CONF_MQTT_PORT,
+                    default=config_entry.data.get(CONF_MQTT_PORT, DEFAULT_MQTT_PORT),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=0xffff)),
+                vol.Required(
+                    CONF_MQTT_USER,
+                    default=config_entry.data.get(CONF_MQTT_USER, DEFAULT_MQTT_USER),
+                ): vol.All(str, vol.Length(min=1)),
+                vol.Required(
+                    CONF_MQTT_PWD,
+                    default=config_entry.data.get(CONF_MQTT_PWD, DEFAULT_MQTT_PWD),
+                ): str,
+                vol.Required(
+                    CONF_MQTT_DISC,
+                    default=config_entry.data.get(CONF_MQTT_DISC, DEFAULT_MQTT_DISC),
+                ): vol.All(str, vol.Length(min=1)),
+                vol.Optional(
+                    CONF_MQTT_CHIRPSTACK_PREFIX,
+                    default=config_entry.data.get(CONF_MQTT_CHIRPSTACK_PREFIX, DEFAULT_MQTT_CHIRPSTACK_PREFIX),
+                ): str,
+                vol.Required(
+                    CONF_OPTIONS_START_DELAY,
+                    default=config_entry.options.get(
+                        CONF_OPTIONS_START_DELAY, DEFAULT_OPTIONS_START_DELAY
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=60)),
+                vol.Required(
+                    CONF_OPTIONS_RESTORE_AGE,
+                    default=config_entry.options.get(
+                        CONF_OPTIONS_RESTORE_AGE, DEFAULT_OPTIONS_RESTORE_AGE
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=60)),
+                vol.Required(
+                    CONF_OPTIONS_DEBUG_PAYLOAD,
+                    default=config_entry.options.get(
+                        CONF_OPTIONS_DEBUG_PAYLOAD, DEFAULT_OPTIONS_DEBUG_PAYLOAD
+                    ),
+                ): bool,
+                vol.Required(
+                    CONF_OPTIONS_LOG_LEVEL,
+                    default=config_entry.options.get(
+                        CONF_OPTIONS_LOG_LEVEL, DEFAULT_OPTIONS_LOG_LEVEL
+                    ),
+                ): SelectSelector(
+                    SelectSelectorConfig(
+                        options=["debug", "info", "warning", "error"],
+                        mode=SelectSelectorMode.DROPDOWN,
+                    )
+                ),
+                vol.Required(
+                    CONF_OPTIONS_ONLINE_PER_DEVICE,
+                    default=config_entry.options.get(
+                        CONF_OPTIONS_ONLINE_PER_DEVICE, DEFAULT_OPTIONS_ONLINE_PER_DEVICE
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=3600)),
+                vol.Required(
+                    CONF_OPTIONS_EXPIRE_AFTER,
+                    default=config_entry.options.get(
+                        CONF_OPTIONS_EXPIRE_AFTER, DEFAULT_OPTIONS_EXPIRE_AFTER
+                    ),
+                ): bool,
+            }
+        )
 
     @property
     def config_entry(self) -> config_entries.ConfigEntry:
@@ -365,25 +504,20 @@ class ChirpOptionsFlow(config_entries.OptionsFlow):
             )
 
             # Check if MQTT settings have changed
-            mqtt_changed = (
-                user_input.get(CONF_MQTT_SERVER) != self.config_entry.data.get(CONF_MQTT_SERVER)
-                or user_input.get(CONF_MQTT_PORT) != self.config_entry.data.get(CONF_MQTT_PORT)
-                or user_input.get(CONF_MQTT_USER) != self.config_entry.data.get(CONF_MQTT_USER)
-                or user_input.get(CONF_MQTT_PWD) != self.config_entry.data.get(CONF_MQTT_PWD)
-                or user_input.get(CONF_MQTT_DISC) != self.config_entry.data.get(CONF_MQTT_DISC)
-                or user_input.get(CONF_MQTT_CHIRPSTACK_PREFIX) != self.config_entry.data.get(CONF_MQTT_CHIRPSTACK_PREFIX)
+            mqtt_changed = _mqtt_settings(user_input) != tuple(
+                self.config_entry.data.get(key) for key in _MQTT_KEYS
             )
 
-            new_data = {**self.config_entry.data}
+            new_data = self.config_entry.data
 
             # If ChirpStack API settings changed, validate the connection
             if api_changed:
                 try:
                     # Create a test configuration with new API settings
-                    test_api_config = {**self.config_entry.data}
-                    test_api_config[CONF_API_SERVER] = user_input[CONF_API_SERVER]
-                    test_api_config[CONF_API_PORT] = user_input[CONF_API_PORT]
-                    test_api_config[CONF_API_KEY] = user_input[CONF_API_KEY]
+                    test_api_config = new_data | {
+                        key: user_input[key]
+                        for key in (CONF_API_SERVER, CONF_API_PORT, CONF_API_KEY)
+                    }
 
                     # Test ChirpStack API connection in executor to avoid blocking
                     def test_api_connection():
@@ -392,10 +526,8 @@ class ChirpOptionsFlow(config_entries.OptionsFlow):
 
                     await self.hass.async_add_executor_job(test_api_connection)
 
-                    # Update new_data with API settings
-                    new_data[CONF_API_SERVER] = user_input[CONF_API_SERVER]
-                    new_data[CONF_API_PORT] = user_input[CONF_API_PORT]
-                    new_data[CONF_API_KEY] = user_input[CONF_API_KEY]
+                    # Tested configuration becomes new entry data
+                    new_data = test_api_config
 
                 except Exception as error:  # pylint: disable=broad-exception-caught
                     _LOGGER.error(
@@ -410,30 +542,30 @@ class ChirpOptionsFlow(config_entries.OptionsFlow):
             if mqtt_changed and not errors:
                 try:
                     # Create a test configuration with new MQTT settings
-                    test_config = {**new_data}
-                    test_config[CONF_MQTT_SERVER] = user_input[CONF_MQTT_SERVER]
-                    test_config[CONF_MQTT_PORT] = user_input[CONF_MQTT_PORT]
-                    test_config[CONF_MQTT_USER] = user_input[CONF_MQTT_USER]
-                    test_config[CONF_MQTT_PWD] = user_input[CONF_MQTT_PWD]
-                    test_config[CONF_MQTT_DISC] = user_input[CONF_MQTT_DISC]
-                    test_config[CONF_MQTT_CHIRPSTACK_PREFIX] = user_input[CONF_MQTT_CHIRPSTACK_PREFIX]
+                    test_config = new_data | {
+                        key: user_input[key] for key in _MQTT_KEYS
+                    }
+
+                    # Reuse the running entry's grpc channel unless API settings changed
+                    # (application id has to be resolved against the new server then)
+                    cached_grpc = None
+                    if not api_changed:
+                        cached_grpc = self.hass.data.get(DOMAIN, {}).get(
+                            self.config_entry.entry_id, {}
+                        ).get(GRPCLIENT)
 
                     # Test MQTT connection in executor to avoid blocking
                     def test_mqtt_connection():
-                        grpc_channel = ChirpGrpc(new_data, None)
+                        grpc_channel = cached_grpc or ChirpGrpc(new_data, None)
                         mqtt_client = ChirpToHA(test_config, None, None, grpc_channel, connectivity_check_only=True)
                         mqtt_client.close()
-                        grpc_channel.close()
+                        if grpc_channel is not cached_grpc:
+                            grpc_channel.close()
 
                     await self.hass.async_add_executor_job(test_mqtt_connection)
 
-                    # Update new_data with MQTT settings
-                    new_data[CONF_MQTT_SERVER] = user_input[CONF_MQTT_SERVER]
-                    new_data[CONF_MQTT_PORT] = user_input[CONF_MQTT_PORT]
-                    new_data[CONF_MQTT_USER] = user_input[CONF_MQTT_USER]
-                    new_data[CONF_MQTT_PWD] = user_input[CONF_MQTT_PWD]
-                    new_data[CONF_MQTT_DISC] = user_input[CONF_MQTT_DISC]
-                    new_data[CONF_MQTT_CHIRPSTACK_PREFIX] = user_input[CONF_MQTT_CHIRPSTACK_PREFIX]
+                    # Tested configuration becomes new entry data
+                    new_data = test_config
 
                 except Exception as error:  # pylint: disable=broad-exception-caught
                     _LOGGER.error(
@@ -465,89 +597,7 @@ class ChirpOptionsFlow(config_entries.OptionsFlow):
 
         return self.async_show_form(
             step_id="init",
-            data_schema=vol.Schema(
-                {
-                    # ChirpStack API Settings
-                    vol.Required(
-                        CONF_API_SERVER,
-                        default=self.config_entry.data.get(CONF_API_SERVER, DEFAULT_API_SERVER),
-                    ): vol.All(str, vol.Length(min=3)),
-                    vol.Required(
-                        CONF_API_PORT,
-                        default=self.config_entry.data.get(CONF_API_PORT, DEFAULT_API_PORT),
-                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=0xffff)),
-                    vol.Required(
-                        CONF_API_KEY,
-                        default=self.config_entry.data.get(CONF_API_KEY, DEFAULT_API_KEY),
-                    ): str,
-                    # MQTT Settings
-                    vol.Required(
-                        CONF_MQTT_SERVER,
-                        default=self.config_entry.data.get(CONF_MQTT_SERVER, DEFAULT_MQTT_SERVER),
-                    ): vol.All(str, vol.Length(min=3)),
-                    vol.Required(
-                        CONF_MQTT_PORT,
-                        default=self.config_entry.data.get(CONF_MQTT_PORT, DEFAULT_MQTT_PORT),
-                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=0xffff)),
-                    vol.Required(
-                        CONF_MQTT_USER,
-                        default=self.config_entry.data.get(CONF_MQTT_USER, DEFAULT_MQTT_USER),
-                    ): vol.All(str, vol.Length(min=1)),
-                    vol.Required(
-                        CONF_MQTT_PWD,
-                        default=self.config_entry.data.get(CONF_MQTT_PWD, DEFAULT_MQTT_PWD),
-                    ): str,
-                    vol.Required(
-                        CONF_MQTT_DISC,
-                        default=self.config_entry.data.get(CONF_MQTT_DISC, DEFAULT_MQTT_DISC),
-                    ): vol.All(str, vol.Length(min=1)),
-                    vol.Optional(
-                        CONF_MQTT_CHIRPSTACK_PREFIX,
-                        default=self.config_entry.data.get(CONF_MQTT_CHIRPSTACK_PREFIX, DEFAULT_MQTT_CHIRPSTACK_PREFIX),
-                    ): str,
-                    vol.Required(
-                        CONF_OPTIONS_START_DELAY,
-                        default=self.config_entry.options.get(
-                            CONF_OPTIONS_START_DELAY, DEFAULT_OPTIONS_START_DELAY
-                        ),
-                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=60)),
-                    vol.Required(
-                        CONF_OPTIONS_RESTORE_AGE,
-                        default=self.config_entry.options.get(
-                            CONF_OPTIONS_RESTORE_AGE, DEFAULT_OPTIONS_RESTORE_AGE
-                        ),
-                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=60)),
-                    vol.Required(
-                        CONF_OPTIONS_DEBUG_PAYLOAD,
-                        default=self.config_entry.options.get(
-                            CONF_OPTIONS_DEBUG_PAYLOAD, DEFAULT_OPTIONS_DEBUG_PAYLOAD
-                        ),
-                    ): bool,
-                    vol.Required(
-                        CONF_OPTIONS_LOG_LEVEL,
-                        default=self.config_entry.options.get(
-                            CONF_OPTIONS_LOG_LEVEL, DEFAULT_OPTIONS_LOG_LEVEL
-                        ),
-                    ): SelectSelector(
-                        SelectSelectorConfig(
-                            options=["debug", "info", "warning", "error"],
-                            mode=SelectSelectorMode.DROPDOWN,
-                        )
-                    ),
-                    vol.Required(
-                        CONF_OPTIONS_ONLINE_PER_DEVICE,
-                        default=self.config_entry.options.get(
-                            CONF_OPTIONS_ONLINE_PER_DEVICE, DEFAULT_OPTIONS_ONLINE_PER_DEVICE
-                        ),
-                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=3600)),
-                    vol.Required(
-                        CONF_OPTIONS_EXPIRE_AFTER,
-                        default=self.config_entry.options.get(
-                            CONF_OPTIONS_EXPIRE_AFTER, DEFAULT_OPTIONS_EXPIRE_AFTER
-                        ),
-                    ): bool,
-                }
-            ),
+            data_schema=self._options_schema,
             errors=errors,
         )
 
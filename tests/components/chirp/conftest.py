@@ -0,0 +1,11 @@
+"""Fixtures for ChirpStack LoRaWAN integration tests."""
+import pytest
+
+from .patches import grpc
+
+
+@pytest.fixture(autouse=True)
+def reset_grpc_channels():
+    """Forget grpc channel mocks opened by previous tests."""
+    grpc.Channel.instances.clear()
+    yield
@@ -669,6 +669,8 @@ class grpc:
 
     class Channel:
         """Channel mock."""
+        instances = []  # opened channels, in creation order
+
         def __init__(
             self,
             target: str,
@@ -681,14 +683,16 @@ class grpc:
             """Prepare channel for test, raise exception if requested."""
             if not get_size("grpc"):
                 raise Exception("Could not connect to grpc server") # pylint: disable=broad-exception-raised
+            self.closed = False
+            grpc.Channel.instances.append(self)
 
         def unary_unary(self,api,request_serializer=None,response_deserializer=None):
             print("grpc ", api)
             pass
 
         def close(self):
-            """Close channel - dummy for mock."""
-            pass
+            """Close channel - record for test."""
+            self.closed = True
 
 class dukpy:
     def __init__(self):
@@ -3,6 +3,8 @@ from unittest import mock
 
 from homeassistant import config_entries, data_entry_flow
 from homeassistant.components.chirp.config_flow import generate_unique_id
+from homeassistant.components.chirp.grpc import ChirpGrpc
+from homeassistant.components.chirp.mqtt import ChirpToHA
 from homeassistant.components.chirp.const import (
     CONF_API_KEY,
     CONF_API_PORT,
@@ -34,6 +36,7 @@ from homeassistant.components.chirp.const import (
     DEFAULT_OPTIONS_RESTORE_AGE,
     DEFAULT_OPTIONS_START_DELAY,
     DOMAIN,
+    GRPCLIENT,
 )
 from homeassistant.core import HomeAssistant
 from tests.common import MockConfigEntry
@@ -45,6 +48,16 @@ from .patches import api, grpc, mqtt, set_size
 # pytest ./tests/components/chirp/test_config_flow.py --cov=homeassistant.components.chirp --cov-report term-missing -vv
 
 
+def _recorded(cls, created):
+    """Return mock side effect creating cls instances and recording (args, instance) pairs."""
+
+    def create(*args, **kwargs):
+        created.append((args, cls(*args, **kwargs)))
+        return created[-1][1]
+
+    return create
+
+
 #@mock.patch("homeassistant.components.chirp.grpc.api", new=api)
 #@mock.patch("homeassistant.components.chirp.grpc.grpc", new=grpc)
 #@mock.patch("homeassistant.components.chirp.mqtt.mqtt", new=mqtt)
@@ -171,6 +184,50 @@ async def test_setup_with_tenant_selection_no_apps(hass: HomeAssistant) -> None:
     assert result["errors"] == {}
 
 
+@mock.patch("homeassistant.components.chirp.grpc.api", new=api)
+@mock.patch("homeassistant.components.chirp.grpc.grpc", new=grpc)
+@mock.patch("homeassistant.components.chirp.mqtt.mqtt", new=mqtt)
+async def test_setup_with_tenant_selection_apps_added(hass: HomeAssistant) -> None:
+    """Test tenant reselection after application was added on ChirpStack server - empty list must not be cached."""
+    set_size()
+
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"],
+        user_input={
+            CONF_API_SERVER: "localhost",
+            CONF_API_PORT: 8080,
+            CONF_API_KEY: common.DEF_API_KEY,
+        },
+    )
+    assert result["type"] == data_entry_flow.FlowResultType.FORM
+    assert result["step_id"] == "select_tenant"
+
+    set_size(applications=0)  # no applications for selected tenant
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"],
+        user_input={
+            CONF_TENANT: "TenantName1",
+        },
+    )
+    assert result["type"] == data_entry_flow.FlowResultType.FORM
+    assert result["step_id"] == "select_tenant"
+    assert result["errors"][CONF_API_SERVER] == CONF_ERROR_NO_APPS
+
+    set_size(applications=1)  # application created on ChirpStack server
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"],
+        user_input={
+            CONF_TENANT: "TenantName1",
+        },
+    )
+    assert result["type"] == data_entry_flow.FlowResultType.FORM
+    assert result["errors"] == {}
+    assert result["step_id"] == "configure_mqtt"
+
+
 @mock.patch("homeassistant.components.chirp.grpc.api", new=api)
 @mock.patch("homeassistant.components.chirp.grpc.grpc", new=grpc)
 @mock.patch("homeassistant.components.chirp.mqtt.mqtt", new=mqtt)
@@ -518,25 +575,40 @@ async def test_options_flow_mqtt_change(hass: HomeAssistant) -> None:
     assert result["step_id"] == "init"
 
     # Update options with new MQTT server
-    result = await hass.config_entries.options.async_configure(
-        result["flow_id"],
-        user_input={
-            CONF_MQTT_SERVER: "mqtt.example.com",
-            CONF_MQTT_PORT: 1884,
-            CONF_MQTT_USER: "newuser",
-            CONF_MQTT_PWD: "newpwd",
-            CONF_MQTT_DISC: "homeassistant",
-            CONF_MQTT_CHIRPSTACK_PREFIX: "chirp/",
-            CONF_OPTIONS_START_DELAY: 5,
-            CONF_OPTIONS_RESTORE_AGE: 10,
-            CONF_OPTIONS_DEBUG_PAYLOAD: True,
-            CONF_OPTIONS_LOG_LEVEL: "debug",
-            CONF_OPTIONS_ONLINE_PER_DEVICE: 60,
-            CONF_OPTIONS_EXPIRE_AFTER: True,
-        },
-    )
+    entry_grpc = hass.data[DOMAIN][entry.entry_id][GRPCLIENT]
+    grpc_clients = []
+    mqtt_probes = []
+    with mock.patch(
+        "homeassistant.components.chirp.config_flow.ChirpGrpc",
+        side_effect=_recorded(ChirpGrpc, grpc_clients),
+    ), mock.patch(
+        "homeassistant.components.chirp.config_flow.ChirpToHA",
+        side_effect=_recorded(ChirpToHA, mqtt_probes),
+    ):
+        result = await hass.config_entries.options.async_configure(
+            result["flow_id"],
+            user_input={
+                CONF_MQTT_SERVER: "mqtt.example.com",
+                CONF_MQTT_PORT: 1884,
+                CONF_MQTT_USER: "newuser",
+                CONF_MQTT_PWD: "newpwd",
+                CONF_MQTT_DISC: "homeassistant",
+                CONF_MQTT_CHIRPSTACK_PREFIX: "chirp/",
+                CONF_OPTIONS_START_DELAY: 5,
+                CONF_OPTIONS_RESTORE_AGE: 10,
+                CONF_OPTIONS_DEBUG_PAYLOAD: True,
+                CONF_OPTIONS_LOG_LEVEL: "debug",
+                CONF_OPTIONS_ONLINE_PER_DEVICE: 60,
+                CONF_OPTIONS_EXPIRE_AFTER: True,
+            },
+        )
     assert result["type"] == data_entry_flow.FlowResultType.CREATE_ENTRY
 
+    # MQTT probe reused loaded entry's grpc channel, no new channel opened
+    assert grpc_clients == []
+    assert len(mqtt_probes) == 1
+    assert mqtt_probes[0][0][3] is entry_grpc
+
     # Verify MQTT settings were updated in entry.data
     updated_entry = hass.config_entries.async_get_entry(entry.entry_id)
     assert updated_entry.data[CONF_MQTT_SERVER] == "mqtt.example.com"
@@ -545,3 +617,171 @@ async def test_options_flow_mqtt_change(hass: HomeAssistant) -> None:
     assert updated_entry.data[CONF_MQTT_PWD] == "newpwd"
     assert updated_entry.data[CONF_MQTT_DISC] == "homeassistant"
     assert updated_entry.data[CONF_MQTT_CHIRPSTACK_PREFIX] == "chirp/"
+
+
+def _configure_api(hass: HomeAssistant, flow_id):
+    """Submit ChirpStack api server configuration step."""
+    return hass.config_entries.flow.async_configure(
+        flow_id,
+        user_input={
+            CONF_API_SERVER: "localhost",
+            CONF_API_PORT: 8080,
+            CONF_API_KEY: common.DEF_API_KEY,
+        },
+    )
+
+
+def _configure_mqtt(hass: HomeAssistant, flow_id):
+    """Submit MQTT server configuration step."""
+    return hass.config_entries.flow.async_configure(
+        flow_id,
+        user_input={
+            CONF_MQTT_SERVER: "localhost",
+            CONF_MQTT_PORT: 1883,
+            CONF_MQTT_USER: "user",
+            CONF_MQTT_PWD: "pwd",
+            CONF_MQTT_DISC: "ha",
+            CONF_MQTT_CHIRPSTACK_PREFIX: "",
+        },
+    )
+
+
+@mock.patch("homeassistant.components.chirp.grpc.api", new=api)
+@mock.patch("homeassistant.components.chirp.grpc.grpc", new=grpc)
+@mock.patch("homeassistant.components.chirp.mqtt.mqtt", new=mqtt)
+async def test_grpc_closed_after_create_entry(hass: HomeAssistant) -> None:
+    """Test if config flow grpc channel is closed once configuration entry is created."""
+    set_size(tenants=1)
+    opened = len(grpc.Channel.instances)
+
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+    result = await _configure_api(hass, result["flow_id"])
+    flow_channel = grpc.Channel.instances[opened]
+    assert not flow_channel.closed
+
+    result = await _configure_mqtt(hass, result["flow_id"])
+    assert result["type"] == data_entry_flow.FlowResultType.CREATE_ENTRY
+    assert flow_channel.closed
+
+    await hass.async_block_till_done()
+    await hass.config_entries.async_unload(result["result"].entry_id)
+
+
+@mock.patch("homeassistant.components.chirp.grpc.api", new=api)
+@mock.patch("homeassistant.components.chirp.grpc.grpc", new=grpc)
+@mock.patch("homeassistant.components.chirp.mqtt.mqtt", new=mqtt)
+async def test_grpc_closed_after_duplicate_abort(hass: HomeAssistant) -> None:
+    """Test if config flow grpc channel is closed when flow aborts on duplicate entry."""
+    set_size(tenants=1)
+
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        unique_id=generate_unique_id(common.CONFIG_DATA),
+        data=common.CONFIG_DATA.copy(),
+        options=common.CONFIG_OPTIONS.copy(),
+    )
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    opened = len(grpc.Channel.instances)
+
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+    result = await _configure_api(hass, result["flow_id"])
+    result = await _configure_mqtt(hass, result["flow_id"])
+    assert result["type"] == data_entry_flow.FlowResultType.ABORT
+    assert result["reason"] == CONF_CHIRP_SERVER_RESERVED
+
+    flow_channels = grpc.Channel.instances[opened:]
+    assert flow_channels
+    assert all(channel.closed for channel in flow_channels)
+
+    await hass.config_entries.async_unload(entry.entry_id)
+
+
+@mock.patch("homeassistant.components.chirp.grpc.api", new=api)
+@mock.patch("homeassistant.components.chirp.grpc.grpc", new=grpc)
+@mock.patch("homeassistant.components.chirp.mqtt.mqtt", new=mqtt)
+async def test_grpc_closed_after_flow_abort(hass: HomeAssistant) -> None:
+    """Test if config flow grpc channel is closed when in-progress flow is aborted."""
+    set_size()
+    opened = len(grpc.Channel.instances)
+
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+    result = await _configure_api(hass, result["flow_id"])
+    assert result["step_id"] == "select_tenant"
+    flow_channel = grpc.Channel.instances[opened]
+    assert not flow_channel.closed
+
+    hass.config_entries.flow.async_abort(result["flow_id"])
+    await hass.async_block_till_done()
+    assert flow_channel.closed
+
+
+@mock.patch("homeassistant.components.chirp.grpc.api", new=api)
+@mock.patch("homeassistant.components.chirp.grpc.grpc", new=grpc)
+@mock.patch("homeassistant.components.chirp.mqtt.mqtt", new=mqtt)
+async def test_options_flow_api_and_mqtt_change(hass: HomeAssistant) -> None:
+    """Test options flow with ChirpStack API and MQTT settings change - MQTT probe uses fresh grpc channel."""
+    set_size(grpc=1, mqtt=1)
+
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        unique_id=generate_unique_id(common.CONFIG_DATA),
+        data=common.CONFIG_DATA.copy(),
+        options=common.CONFIG_OPTIONS.copy(),
+    )
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    entry_grpc = hass.data[DOMAIN][entry.entry_id][GRPCLIENT]
+
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    assert result["type"] == data_entry_flow.FlowResultType.FORM
+    assert result["step_id"] == "init"
+
+    grpc_clients = []
+    mqtt_probes = []
+    with mock.patch(
+        "homeassistant.components.chirp.config_flow.ChirpGrpc",
+        side_effect=_recorded(ChirpGrpc, grpc_clients),
+    ), mock.patch(
+        "homeassistant.components.chirp.config_flow.ChirpToHA",
+        side_effect=_recorded(ChirpToHA, mqtt_probes),
+    ):
+        result = await hass.config_entries.options.async_configure(
+            result["flow_id"],
+            user_input={
+                CONF_API_SERVER: "chirp.example.com",
+                CONF_API_PORT: 8081,
+                CONF_API_KEY: "newapikey0newapikey0",
+                CONF_MQTT_SERVER: "mqtt.example.com",
+                CONF_MQTT_PORT: 1884,
+                CONF_MQTT_USER: "newuser",
+                CONF_MQTT_PWD: "newpwd",
+                CONF_MQTT_DISC: "homeassistant",
+                CONF_MQTT_CHIRPSTACK_PREFIX: "chirp/",
+                CONF_OPTIONS_START_DELAY: 5,
+                CONF_OPTIONS_RESTORE_AGE: 10,
+                CONF_OPTIONS_DEBUG_PAYLOAD: True,
+                CONF_OPTIONS_LOG_LEVEL: "debug",
+                CONF_OPTIONS_ONLINE_PER_DEVICE: 60,
+                CONF_OPTIONS_EXPIRE_AFTER: True,
+            },
+        )
+    assert result["type"] == data_entry_flow.FlowResultType.CREATE_ENTRY
+
+    # API check and MQTT probe each opened (and closed) their own channel to new API server
+    assert len(grpc_clients) == 2
+    for args, grpc_client in grpc_clients:
+        assert args[0][CONF_API_SERVER] == "chirp.example.com"
+        assert grpc_client._channel.closed
+    assert len(mqtt_probes) == 1
+    assert mqtt_probes[0][0][3] is grpc_clients[1][1]
+    assert mqtt_probes[0][0][3] is not entry_grpc
+
+    await hass.async_block_till_done()
+    await hass.config_entries.async_unload(entry.entry_id)
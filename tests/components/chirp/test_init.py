@@ -1,12 +1,48 @@
 """Test the ChirpStack LoRaWAN integration initilization path initiated from __init__.py."""
+import hashlib
+from unittest import mock
+
+from homeassistant import config_entries, data_entry_flow
 from homeassistant.config_entries import ConfigEntryState
 from homeassistant.core import HomeAssistant
+from tests.common import MockConfigEntry
 from tests.components.chirp import common
+from homeassistant.components.chirp.config_flow import generate_unique_id
 from homeassistant.components.chirp.const import (
+    CONF_API_KEY,
+    CONF_API_PORT,
+    CONF_API_SERVER,
+    CONF_APPLICATION,
+    CONF_CHIRP_SERVER_RESERVED,
     CONF_MQTT_CHIRPSTACK_PREFIX,
+    CONF_MQTT_DISC,
+    CONF_MQTT_PORT,
+    CONF_MQTT_PWD,
+    CONF_MQTT_SERVER,
+    CONF_MQTT_USER,
+    CONF_TENANT,
     BRIDGE_CONF_COUNT,
+    DOMAIN,
 )
-from .patches import get_size, message, mqtt, set_size
+from .patches import api, get_size, grpc, message, mqtt, set_size
+
+
+def md5_unique_id(configuration):
+    """Create unique id the way version 1 config entries did."""
+    u_id = "".join(
+        str(configuration[id_key])
+        for id_key in (
+            CONF_API_SERVER,
+            CONF_API_PORT,
+            CONF_TENANT,
+            CONF_APPLICATION,
+            CONF_MQTT_SERVER,
+            CONF_MQTT_PORT,
+            CONF_MQTT_DISC,
+            CONF_MQTT_CHIRPSTACK_PREFIX,
+        )
+    )
+    return hashlib.md5(u_id.encode("utf-8")).hexdigest()
 
 async def test_entry_setup_unload(hass: HomeAssistant):
     """Test if integration unloads with default configuration."""
@@ -51,3 +87,77 @@ async def test_empty_chirpstack_prefix(hass: HomeAssistant):
         assert configs == 0
 
     await common.chirp_setup_and_run_test(hass, True, run_test_entry_setup_unload)
+
+
+@mock.patch("homeassistant.components.chirp.grpc.api", new=api)
+@mock.patch("homeassistant.components.chirp.grpc.grpc", new=grpc)
+@mock.patch("homeassistant.components.chirp.mqtt.mqtt", new=mqtt)
+async def test_migrate_entry_unique_id(hass: HomeAssistant):
+    """Test if version 1 entry with md5 unique id is migrated to version 2."""
+    set_size()
+
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        version=1,
+        unique_id=md5_unique_id(common.CONFIG_DATA),
+        data=common.CONFIG_DATA.copy(),
+        options=common.CONFIG_OPTIONS.copy(),
+    )
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert entry.state is ConfigEntryState.LOADED
+    assert entry.version == 2
+    assert entry.unique_id == generate_unique_id(entry.data)
+    assert entry.unique_id != md5_unique_id(entry.data)
+
+    await hass.config_entries.async_unload(entry.entry_id)
+
+
+@mock.patch("homeassistant.components.chirp.grpc.api", new=api)
+@mock.patch("homeassistant.components.chirp.grpc.grpc", new=grpc)
+@mock.patch("homeassistant.components.chirp.mqtt.mqtt", new=mqtt)
+async def test_migrated_entry_duplicate_detected(hass: HomeAssistant):
+    """Test if config flow detects duplicate of migrated version 1 entry."""
+    set_size(tenants=1)
+
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        version=1,
+        unique_id=md5_unique_id(common.CONFIG_DATA),
+        data=common.CONFIG_DATA.copy(),
+        options=common.CONFIG_OPTIONS.copy(),
+    )
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    assert entry.version == 2
+
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"],
+        user_input={
+            CONF_API_SERVER: common.CONFIG_DATA[CONF_API_SERVER],
+            CONF_API_PORT: common.CONFIG_DATA[CONF_API_PORT],
+            CONF_API_KEY: common.CONFIG_DATA[CONF_API_KEY],
+        },
+    )
+    assert result["step_id"] == "configure_mqtt"
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"],
+        user_input={
+            CONF_MQTT_SERVER: common.CONFIG_DATA[CONF_MQTT_SERVER],
+            CONF_MQTT_PORT: common.CONFIG_DATA[CONF_MQTT_PORT],
+            CONF_MQTT_USER: common.CONFIG_DATA[CONF_MQTT_USER],
+            CONF_MQTT_PWD: common.CONFIG_DATA[CONF_MQTT_PWD],
+            CONF_MQTT_DISC: common.CONFIG_DATA[CONF_MQTT_DISC],
+            CONF_MQTT_CHIRPSTACK_PREFIX: common.CONFIG_DATA[CONF_MQTT_CHIRPSTACK_PREFIX],
+        },
+    )
+    assert result["type"] == data_entry_flow.FlowResultType.ABORT
+    assert result["reason"] == CONF_CHIRP_SERVER_RESERVED
+
+    await hass.config_entries.async_unload(entry.entry_id)